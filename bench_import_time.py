@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import argparse
+import subprocess
+
+
+# Modules that must not be loaded just to parse the command line.
+HEAVY_MODULES = ['networkx', 'matplotlib', 'docplex', 'numpy', 'pandas']
+
+PROBE = """
+import sys
+import main
+main.get_parser()
+print(','.join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description="MyersonOntology_import_time")
+
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max_ms", type=float, default=500.0, help="fail above this startup time")
+
+    return parser
+
+
+def measure_startup(repeat):
+    probe = PROBE.format(heavy=HEAVY_MODULES)
+    root = os.path.dirname(os.path.abspath(__file__))
+    times = []
+    loaded = ''
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        out = subprocess.run([sys.executable, '-c', probe], cwd=root, check=True,
+                             capture_output=True, text=True)
+        times.append((time.perf_counter() - start_time) * 1000)
+        loaded = out.stdout.strip()
+
+    return times, loaded
+
+
+if __name__ == '__main__':
+    parser = get_parser()
+    args = parser.parse_args()
+
+    times, loaded = measure_startup(args.repeat)
+    best = min(times)
+
+    print(f"startup (best of {args.repeat}): {best:.1f} ms")
+    print(f"startup (mean): {sum(times) / len(times):.1f} ms")
+    print(f"heavy modules loaded: {loaded or 'none'}")
+
+    if loaded or best > args.max_ms:
+        sys.exit(1)
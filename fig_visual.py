@@ -1,47 +1,31 @@
 import os
 import argparse
-import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.gridspec import GridSpec
 
 from src.OWL_tool import OWLLoad
 
 
 def get_parser():
     parser = argparse.ArgumentParser(description="MyersonOntology_visual")
+    add_arguments(parser)
 
+    return parser
+
+
+def add_arguments(parser):
     parser.add_argument("--ontology", type=str, default="AROMA-cmt-cocus")
     parser.add_argument("--seed", type=int, default=0)
     parser.add_argument("--density", type=float, default=0.15)
+    parser.add_argument("--graph_dir", type=str, default="./data/graph")
     parser.add_argument("--nx_seed", type=int, default=0)
 
-    return parser
-
-
-def generate_random_graph(nodes, onto_mups_f_dict, nx_seed, density):
-    graph = nx.gnp_random_graph(nodes, density, seed=nx_seed, directed=True)
-
-    g_nodes = graph.nodes
-
-    illegal_edges = set(((i, j) for i in g_nodes for j in g_nodes))
-
-    for mups_dict in onto_mups_f_dict:
-        mups_f_list = [int(n) for n in list(mups_dict.keys())]
-        permit_edges = set(((i, j) for i in mups_f_list for j in mups_f_list if i != j))
-        illegal_edges = illegal_edges - permit_edges
 
-    del_edge = []
-    for e in graph.edges:
-        if e in illegal_edges:
-            del_edge.append(e)
-
-    for de in del_edge:
-        graph.remove_edge(de[0], de[1])
-
-    return graph
+def main(args, onto):
+    import networkx as nx
+    import matplotlib.pyplot as plt
+    from matplotlib.gridspec import GridSpec
 
+    from src.graph_store import load_ontology_graph
 
-def main(args, onto):
     # Load ontology by MUPS.
     mups_path = os.path.join('./data/mups', args.ontology, 'res.txt')
     ontology = OWLLoad(mups_path)
@@ -57,7 +41,8 @@ def main(args, onto):
 
     # Create a randomized directed graph of the ontology.
     graph_density = args.density
-    ontology_graph = generate_random_graph(len(onto_formula_dict), onto_mups_f_dict, args.nx_seed, graph_density)
+    ontology_graph = load_ontology_graph(args.graph_dir, args.ontology, mups_path,
+                                         len(onto_formula_dict), onto_mups_f_dict, args.nx_seed, graph_density)
     print("")
     print(f"ontology graph: {len(ontology_graph.nodes)} nodes, {len(ontology_graph.edges)} edges, {args.density} density.")
 
@@ -175,8 +160,12 @@ def main(args, onto):
     plt.savefig('./figureIMG1.png')
 
 
+def run(args):
+    main(args, args.ontology)
+
+
 if __name__ == '__main__':
     parser = get_parser()
     args = parser.parse_args()
 
-    main(args, args.ontology)
+    run(args)
@@ -0,0 +1,32 @@
+import argparse
+import importlib
+
+
+# subcommand -> (module, help). The modules keep networkx, matplotlib and
+# docplex out of their top-level imports, so `--help` stays cheap.
+COMMANDS = {
+    'repair': ('ontology_myerson', 'repair ontologies with the basic and Myerson weighted models'),
+    'visualize': ('ontology_graph_visualization', 'draw the graph of each ontology and its MUPSs'),
+    'figure': ('fig_visual', 'draw the figure of one ontology used in the paper'),
+}
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description="MyersonOntology")
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.required = True
+
+    for command, (module_name, command_help) in COMMANDS.items():
+        module = importlib.import_module(module_name)
+        subparser = subparsers.add_parser(command, help=command_help)
+        module.add_arguments(subparser)
+        subparser.set_defaults(module=module)
+
+    return parser
+
+
+if __name__ == '__main__':
+    parser = get_parser()
+    args = parser.parse_args()
+
+    args.module.run(args)
@@ -3,11 +3,9 @@ import datetime
 import argparse
 import logging
 
-import networkx as nx
 from fractions import Fraction
 
 from src.OWL_tool import OWLLoad
-from src.ILP_model import solving_cardinal_minimum_solution, solving_myerson_weighted_solution
 
 
 def get_logger(log_pth):
@@ -30,14 +28,18 @@ def get_logger(log_pth):
 
 def get_parser():
     parser = argparse.ArgumentParser(description="MyersonOntology")
+    add_arguments(parser)
 
+    return parser
+
+
+def add_arguments(parser):
     parser.add_argument("--dumped", type=str, default="./log")
     parser.add_argument("--ontology", type=str, default="all", help="all")
     parser.add_argument("--density", type=float, default=0.15)
+    parser.add_argument("--graph_dir", type=str, default="./data/graph")
     parser.add_argument("--nx_seed", type=int, default=30)
 
-    return parser
-
 
 def get_subdirectories(folder):
     subdirectories = []
@@ -47,30 +49,12 @@ def get_subdirectories(folder):
     return subdirectories
 
 
-def generate_random_graph(nodes, onto_mups_f_dict, nx_seed, density):
-    graph = nx.gnp_random_graph(nodes, density, seed=nx_seed, directed=True)
-
-    g_nodes = graph.nodes
-
-    illegal_edges = set(((i, j) for i in g_nodes for j in g_nodes))
-
-    for mups_dict in onto_mups_f_dict:
-        mups_f_list = [int(n) for n in list(mups_dict.keys())]
-        permit_edges = set(((i, j) for i in mups_f_list for j in mups_f_list if i != j))
-        illegal_edges = illegal_edges - permit_edges
-
-    del_edge = []
-    for e in graph.edges:
-        if e in illegal_edges:
-            del_edge.append(e)
-
-    for de in del_edge:
-        graph.remove_edge(de[0], de[1])
-
-    return graph
+def main(logger, args, mups, metrics, nx_seed):
+    import networkx as nx
 
+    from src.graph_store import load_ontology_graph
+    from src.ILP_model import solving_cardinal_minimum_solution, solving_myerson_weighted_solution
 
-def main(logger, args, mups, metrics, nx_seed):
     # Load ontology by MUPS.
     mups_path = os.path.join('./data/mups', mups, 'res.txt')
     ontology = OWLLoad(mups_path)
@@ -87,7 +71,8 @@ def main(logger, args, mups, metrics, nx_seed):
 
     # Create a randomized directed graph of the ontology.
     graph_density = args.density
-    ontology_graph = generate_random_graph(len(onto_formula_dict), onto_mups_f_dict, nx_seed, graph_density)
+    ontology_graph = load_ontology_graph(args.graph_dir, mups, mups_path,
+                                         len(onto_formula_dict), onto_mups_f_dict, nx_seed, graph_density)
     logger.info(f"ontology graph: {len(ontology_graph.nodes)} nodes, {len(ontology_graph.edges)} edges.")
     logger.info("-" * 48)
 
@@ -173,10 +158,7 @@ def main(logger, args, mups, metrics, nx_seed):
     return metrics
 
 
-if __name__ == '__main__':
-    parser = get_parser()
-    args = parser.parse_args()
-
+def run(args):
     ONTOLOGY = args.ontology
 
     log_pth = os.path.join(args.dumped, ONTOLOGY + ".log")
@@ -203,3 +185,10 @@ if __name__ == '__main__':
     logger.info("Summary")
     for k, v in metrics.items():
         logger.info(f"ONTOLOGY {k}: BASIC MODEL reduces edges by {(sum(v[0]) / len(v[0])):.2f} %, Myerson MODEL reduces edges by {(sum(v[1]) / len(v[1])):.2f} %.")
+
+
+if __name__ == '__main__':
+    parser = get_parser()
+    args = parser.parse_args()
+
+    run(args)
@@ -1,8 +1,3 @@
-import copy
-import pandas as pd
-import numpy as np
-
-
 class OWLLoad:
     def __init__(self, pth):
 
@@ -37,7 +32,7 @@ class OWLLoad:
                     mups_start = False
                     if not len(mups_single) == 0:
                         if not set(mups_single) in self.mups_list:
-                            self.mups_list.append(copy.deepcopy(set(mups_single)))
+                            self.mups_list.append(set(mups_single))
                         mups_single.clear()
             else:
                 mups_start = True
@@ -0,0 +1,230 @@
+import os
+import json
+import struct
+import hashlib
+import tempfile
+import contextlib
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+import numpy as np
+import networkx as nx
+
+
+STORE_MAGIC = b'MYGS0002'
+
+
+def generate_random_graph(nodes, onto_mups_f_dict, nx_seed, density):
+    graph = nx.gnp_random_graph(nodes, density, seed=nx_seed, directed=True)
+
+    # An edge is kept only if both ends appear together in some MUPS.
+    permit_edges = set()
+    for mups_dict in onto_mups_f_dict:
+        mups_f_list = [int(n) for n in list(mups_dict.keys())]
+        permit_edges.update(((i, j) for i in mups_f_list for j in mups_f_list if i != j))
+
+    del_edge = []
+    for e in graph.edges:
+        if e not in permit_edges:
+            del_edge.append(e)
+
+    for de in del_edge:
+        graph.remove_edge(de[0], de[1])
+
+    return graph
+
+
+def file_sha256(pth):
+    sha = hashlib.sha256()
+    with open(pth, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+class GraphStore:
+    '''
+    Per-ontology store of the seeded random graphs.
+
+    Every (seed, density) graph of an ontology is kept as an int32 edge array
+    in a single file, ``<store_dir>/<onto>.graph``:
+
+        magic (8 bytes) | edges ... | JSON index | index length (uint64) | magic
+
+    The index records the SHA-256 of the MUPS file, the number of nodes and
+    the offset/length of every edge array. Edge arrays are read through
+    ``np.memmap``; a store that is corrupt or whose MUPS hash differs from the
+    current file is discarded and rebuilt.
+
+    A new graph is appended after the existing arrays and only the index is
+    rewritten. Writers hold an exclusive ``fcntl.flock`` on ``<onto>.graph.lock``
+    and re-read the index under it, so parallel runs on one ontology keep
+    each other's graphs. Where ``fcntl`` is unavailable (Windows) the store is
+    rewritten through a temporary file instead and the last writer wins.
+    '''
+
+    def __init__(self, store_dir, onto, mups_path):
+
+        self.store_path = os.path.join(store_dir, onto + '.graph')
+        self.mups_path = mups_path
+        self.mups_hash = file_sha256(mups_path)
+        self.header = None
+        self.data_end = None
+        with self.store_lock(exclusive=False):
+            self.header_read()
+
+    @staticmethod
+    def graph_key(nx_seed, density):
+        return f"{int(nx_seed)}:{float(density)!r}"
+
+    @contextlib.contextmanager
+    def store_lock(self, exclusive):
+        if fcntl is None:
+            yield
+            return
+
+        os.makedirs(os.path.dirname(self.store_path) or '.', exist_ok=True)
+        with open(self.store_path + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def header_read(self):
+        self.header = None
+        self.data_end = None
+        if not os.path.exists(self.store_path):
+            return
+
+        # A truncated or corrupt store is treated like a hash mismatch: rebuilt.
+        trailer_len = 8 + len(STORE_MAGIC)
+        with open(self.store_path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            if file_size < len(STORE_MAGIC) + trailer_len or f.read(len(STORE_MAGIC)) != STORE_MAGIC:
+                return
+            f.seek(file_size - trailer_len)
+            trailer = f.read(trailer_len)
+            if trailer[8:] != STORE_MAGIC:
+                return
+            try:
+                header_len, = struct.unpack('<Q', trailer[:8])
+                data_end = file_size - trailer_len - header_len
+                if data_end < len(STORE_MAGIC):
+                    return
+                f.seek(data_end)
+                header = json.loads(f.read(header_len).decode('utf-8'))
+            except (struct.error, ValueError, UnicodeDecodeError):
+                return
+
+        if not isinstance(header, dict) or header.get('mups_sha256') != self.mups_hash:
+            return
+        if not isinstance(header.get('nodes'), int) or not isinstance(header.get('graphs'), dict):
+            return
+
+        try:
+            for offset, n_edges in header['graphs'].values():
+                if offset < len(STORE_MAGIC) or n_edges < 0 or offset + n_edges * 8 > data_end:
+                    return
+        except (TypeError, ValueError):
+            return
+
+        self.header = header
+        self.data_end = data_end
+
+    def edges_read(self, key):
+        '''
+        Memory-map the edge array of one graph, shape (n_edges, 2).
+        '''
+        offset, n_edges = self.header['graphs'][key]
+        if n_edges == 0:
+            return np.empty((0, 2), dtype=np.int32)
+        return np.memmap(self.store_path, dtype=np.int32, mode='r',
+                         offset=offset, shape=(n_edges, 2))
+
+    def index_write(self, f, nodes, entries):
+        header = json.dumps({'mups_sha256': self.mups_hash,
+                             'nodes': nodes,
+                             'graphs': entries}).encode('utf-8')
+        f.write(header)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(STORE_MAGIC)
+
+    def store_write(self, nodes, graphs):
+        '''
+        Rewrite the store with ``graphs``, a dict of key -> int32 edge array.
+        '''
+        store_dir = os.path.dirname(self.store_path) or '.'
+        os.makedirs(store_dir, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=store_dir, prefix=os.path.basename(self.store_path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(STORE_MAGIC)
+                entries = {}
+                for key, edges in graphs.items():
+                    entries[key] = [f.tell(), int(edges.shape[0])]
+                    f.write(np.ascontiguousarray(edges, dtype='<i4').tobytes())
+                self.index_write(f, nodes, entries)
+            os.replace(tmp_path, self.store_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.header_read()
+
+    def store_append(self, key, edges):
+        '''
+        Append one edge array after the existing ones and rewrite the index.
+        Must be called under the exclusive store lock.
+        '''
+        entries = dict(self.header['graphs'])
+        with open(self.store_path, 'r+b') as f:
+            f.seek(self.data_end)
+            entries[key] = [self.data_end, int(edges.shape[0])]
+            f.write(np.ascontiguousarray(edges, dtype='<i4').tobytes())
+            self.index_write(f, self.header['nodes'], entries)
+            f.truncate()
+
+        self.header_read()
+
+    def get_graph(self, nodes, onto_mups_f_dict, nx_seed, density):
+        '''
+        Return the ontology graph for (nx_seed, density), generating and
+        storing it on the first request.
+        '''
+        key = self.graph_key(nx_seed, density)
+
+        if self.header is not None and self.header['nodes'] == nodes and key in self.header['graphs']:
+            graph = nx.DiGraph()
+            graph.add_nodes_from(range(nodes))
+            graph.add_edges_from(self.edges_read(key).tolist())
+            return graph
+
+        graph = generate_random_graph(nodes, onto_mups_f_dict, nx_seed, density)
+        edges = np.array(list(graph.edges), dtype=np.int32).reshape(-1, 2)
+
+        with self.store_lock(exclusive=True):
+            # Another process may have written the store since it was read.
+            self.header_read()
+            if self.header is None or self.header['nodes'] != nodes:
+                self.store_write(nodes, {key: edges})
+            elif key in self.header['graphs']:
+                pass
+            elif fcntl is not None:
+                self.store_append(key, edges)
+            else:
+                graphs = {k: np.array(self.edges_read(k)) for k in self.header['graphs']}
+                graphs[key] = edges
+                self.store_write(nodes, graphs)
+
+        return graph
+
+
+def load_ontology_graph(store_dir, onto, mups_path, nodes, onto_mups_f_dict, nx_seed, density):
+    store = GraphStore(store_dir, onto, mups_path)
+    return store.get_graph(nodes, onto_mups_f_dict, nx_seed, density)